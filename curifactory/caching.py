@@ -14,12 +14,32 @@ import os
 import pickle
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
-import pandas as pd
+from curifactory import utils
 
-from curifactory import hashing, utils
+# NOTE: pandas is only needed by the pandas cachers and is a large part of
+# curifactory's import time, so it's imported where it's used.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@cache
+def _cacher_type_string(cacher_class: type) -> str:
+    """The ``cacher_type`` metadata value for a cacher class, computed once per class."""
+    return str(cacher_class)
+
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type)
+"""Attribute value types ``Cacheable.__deepcopy__`` shares rather than copies."""
+
+
+def _file_signature(stat: os.stat_result) -> tuple:
+    """The parts of a file's stat that change when it's rewritten or replaced. The inode
+    is included since mtimes can be as coarse as a second on some filesystems."""
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
 
 class Lazy:
@@ -196,6 +216,18 @@ class Cacheable:
         """Whether to store the artifact this cacher is used with in the run folder on store-full runs or not."""
         self.cache_paths: list[str] = []
         """The running list of paths this cacher is using, as appended by ``get_path``."""
+        self._cache_paths_set: set[str] = set()
+        """Set mirror of ``cache_paths`` for the membership check in ``get_path``."""
+        self._resolved_templates: dict[tuple, str] = {}
+        """Memoized ``_resolve_path_template`` results, keyed on everything the
+        resolved path depends on."""
+        self._loaded_metadata: dict = None
+        """The metadata dictionary most recently parsed by ``load_metadata``."""
+        self._loaded_metadata_key: tuple = None
+        """The path and ``_file_signature`` of the file ``_loaded_metadata`` was parsed from."""
+        self._saved_metadata: tuple = None
+        """The path, ``_file_signature`` and contents of the metadata file most recently
+        written by ``save_metadata``."""
         self.metadata: dict = None
         """Metadata about the artifact cached with this cacheable."""
         self.extra_metadata: dict = {}
@@ -214,19 +246,15 @@ class Cacheable:
         """Handles determining the final suffix of a path based on the extension of
         this cacheable and whether a specific suffix was requested or not."""
 
+        if suffix is not None:
+            return suffix
+
         # this is the logic to add an extension if no suffix supplied and the
         # object name/override path doesn't already contain the extension
-        if suffix is None and (
-            self.extension is not None
-            and self.extension != ""
-            and not path.endswith(self.extension)
-            and add_extension
-        ):
-            suffix = self.extension
-        elif suffix is None:
-            suffix = ""
-
-        return suffix
+        # (an extension of either None or "" means there's nothing to add)
+        if add_extension and self.extension and not path.endswith(self.extension):
+            return self.extension
+        return ""
 
     def _resolve_path_template(self, path: str) -> str:
         """Intended for when path_override is specified, this returns the path with
@@ -252,8 +280,31 @@ class Cacheable:
         if self.record is None:
             return path
 
+        # nothing to resolve if the path doesn't contain any replacement fields
+        if "{" not in path and "}" not in path:
+            return path
+
+        # get_path (and so this) gets called several times per save/load/check, so
+        # re-use the resolved path as long as nothing it depends on has changed.
+        manager = self.record.manager
+        memo_key = (
+            path,
+            id(self.record),
+            self.record.get_hash(),
+            id(self.record.params),
+            self.name,
+            self.stage,
+            self.extension,
+            manager.cache_path,
+            manager.experiment_name,
+            manager.prefix,
+            manager.current_stage_name,
+        )
+        if memo_key in self._resolved_templates:
+            return self._resolved_templates[memo_key]
+
         # make sure the cache path doesn't include final /
-        cache_path = self.record.manager.cache_path
+        cache_path = manager.cache_path
         if cache_path.endswith("/"):
             cache_path = cache_path[:-1]
 
@@ -272,15 +323,17 @@ class Cacheable:
             obj_name, self.record
         )
 
-        return path.format(
+        resolved_path = path.format(
             hash=self.record.get_hash(),
             cache=cache_path,
             stage=self.stage,
             name=self.name,
             params=self.record.params,
-            experiment=self.record.manager.experiment_name,
+            experiment=manager.experiment_name,
             artifact_filename=artifact_filename,
         )
+        self._resolved_templates[memo_key] = resolved_path
+        return resolved_path
 
     def get_path(self, suffix=None) -> str:
         """Retrieve the full filepath to use for saving and loading. This should be called in the ``save()`` and
@@ -315,13 +368,8 @@ class Cacheable:
             # someone calls record.get_path and passes it in here, that get_path won't
             # auto handle an extension, and we need this get_path to return the same
             # thing as expected from record.get_path for tracking to work.
-            if (
-                self.extension != ""
-                and self.extension is not None
-                and path.endswith(self.extension)
-                and suffix is not None
-            ):
-                path = path[: path.rindex(self.extension)]
+            if suffix is not None and self.extension and path.endswith(self.extension):
+                path = path[: -len(self.extension)]
 
             suffix = self._resolve_suffix(path, suffix, False)
             path = path + suffix
@@ -344,8 +392,9 @@ class Cacheable:
                 stage_name=self.stage,
                 track=self.track,
             )
-        if path not in self.cache_paths:
+        if path not in self._cache_paths_set:
             self.cache_paths.append(path)
+            self._cache_paths_set.add(path)
         return path
 
     def get_dir(self, suffix=None) -> str:
@@ -374,6 +423,23 @@ class Cacheable:
         if not self.record.manager.map_mode:
             self.collect_metadata()
 
+    def __deepcopy__(self, memo: dict) -> "Cacheable":
+        """Copy this cacheable, e.g. for stages to get their own instance per call.
+
+        The associated record is shared by reference rather than copied - deep copying
+        it would copy the entire record state (and its manager) only to have it replaced
+        by ``set_record`` anyway. Immutable values are shared as-is, and everything else
+        (including any subclass state) is deep copied.
+        """
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            if name == "record" or value is None or type(value) in _IMMUTABLE_TYPES:
+                copied.__dict__[name] = value
+            else:
+                copied.__dict__[name] = copy.deepcopy(value, memo)
+        return copied
+
     def collect_metadata(self):
         if self.record is None:
             raise RuntimeError(
@@ -403,37 +469,83 @@ class Cacheable:
             record_name=self.record.get_reference_name(),
             stage=self.record.manager.current_stage_name,
             artifact_name=self.name,
-            cacher_type=str(type(self)),
+            cacher_type=_cacher_type_string(type(self)),
             record_prior_stages=self.record.stages[:-1],
             prior_records=input_record_names,
-            params=hashing.param_set_string_hash_representations(self.record.params)
-            if self.record.params is not None
-            else None,
+            params=self.record.get_params_string_reps(),
             extra=self.extra_metadata,  # cachers can store any additional info here they want.
             manager_run_info=manager_run_info,
         )
 
     def save_metadata(self):
         metadata_path = self.get_path("_metadata.json")
-        with open(metadata_path, "w") as outfile:
-            if self.metadata is None:
-                # this either means we haven't collected metadata, or this is save() being called inline
-                # logging.warning(
-                #     "Cacher metadata hasn't been collected or has no associated record. Only saving extra_metadata fields."
-                # )
-                json.dump(
-                    dict(extra=self.extra_metadata), outfile, indent=2, default=str
-                )
-            else:
-                self.metadata["extra"].update(self.extra_metadata)
-                json.dump(self.metadata, outfile, indent=2, default=str)
+        if self.metadata is None:
+            # this either means we haven't collected metadata, or this is save() being called inline
+            # logging.warning(
+            #     "Cacher metadata hasn't been collected or has no associated record. Only saving extra_metadata fields."
+            # )
+            contents = json.dumps(
+                dict(extra=self.extra_metadata), indent=2, default=str
+            )
+        else:
+            self.metadata["extra"].update(self.extra_metadata)
+            contents = json.dumps(self.metadata, indent=2, default=str)
+
+        # skip the write entirely if we already wrote these exact contents to this
+        # path and the file hasn't been touched since.
+        if self._saved_metadata is not None:
+            saved_path, saved_signature, saved_contents = self._saved_metadata
+            if saved_path == metadata_path and saved_contents == contents:
+                try:
+                    if _file_signature(os.stat(metadata_path)) == saved_signature:
+                        return
+                except OSError:
+                    pass
+
+        # write to a temporary file first and swap it into place, so that a
+        # crashed/interrupted run (or a parallel process reading it) never sees a
+        # partially written metadata file.
+        tmp_path = f"{metadata_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as outfile:
+                outfile.write(contents)
+            os.replace(tmp_path, metadata_path)
+        except BaseException:
+            # don't leave the partial temporary file behind in the cache
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._saved_metadata = (
+            metadata_path,
+            _file_signature(os.stat(metadata_path)),
+            contents,
+        )
 
     def load_metadata(self) -> dict:
         metadata_path = self.get_path("_metadata.json")
-        if os.path.exists(metadata_path):
-            with open(metadata_path) as infile:
-                self.metadata = json.load(infile)
-                self.extra_metadata = self.metadata["extra"]
+        try:
+            stat = os.stat(metadata_path)
+        except OSError:
+            return self.metadata
+
+        # a stage's check() and load() often both load the metadata, skip re-parsing
+        # if we already parsed this exact file and haven't replaced the metadata since.
+        key = (metadata_path, _file_signature(stat))
+        if (
+            self._loaded_metadata_key == key
+            and self.metadata is not None
+            and self.metadata is self._loaded_metadata
+        ):
+            self.extra_metadata = self.metadata["extra"]
+            return self.metadata
+
+        with open(metadata_path) as infile:
+            self.metadata = json.load(infile)
+            self.extra_metadata = self.metadata["extra"]
+        self._loaded_metadata = self.metadata
+        self._loaded_metadata_key = key
         return self.metadata
 
     def check(self) -> bool:
@@ -446,8 +558,10 @@ class Cacheable:
             ``True`` if we find the cached file and the current parameter set
             doesn't specify to overwrite, otherwise ``False``.
         """
-        logging.debug("Searching for cached file at '%s'...", self.get_path())
-        if os.path.exists(self.get_path()):
+        # resolve the path once, get_path re-resolves the template on every call
+        path = self.get_path()
+        logging.debug("Searching for cached file at '%s'...", path)
+        if os.path.exists(path):
             if (
                 self.record is not None
                 and self.record.params is None
@@ -471,9 +585,9 @@ class Cacheable:
                 # we made it through each record and they weren't overwrite, we're good
                 logging.debug("No records had overwrite, will use cache")
                 if self.record.manager.map_mode:
-                    logging.debug("Cached object '%s' found", self.get_path())
+                    logging.debug("Cached object '%s' found", path)
                 else:
-                    logging.info("Cached object '%s' found", self.get_path())
+                    logging.info("Cached object '%s' found", path)
                 return True
             elif (
                 self.record is not None
@@ -481,14 +595,14 @@ class Cacheable:
                 and not self.record.params.overwrite
             ):
                 if self.record.manager.map_mode:
-                    logging.debug("Cached object '%s' found", self.get_path())
+                    logging.debug("Cached object '%s' found", path)
                 else:
-                    logging.info("Cached object '%s' found", self.get_path())
+                    logging.info("Cached object '%s' found", path)
                 return True
             elif self.record is None:
                 # if we don't have a record (e.g. running check on a manual cacher with a
                 # path override specified), don't worry about overwrite logic.
-                logging.info("Cached object '%s' found", self.get_path())
+                logging.info("Cached object '%s' found", path)
                 return True
             else:
                 logging.debug("Object found, but overwrite specified in args")
@@ -531,12 +645,12 @@ class JsonCacher(Cacheable):
     def save(self, obj) -> str:
         path = self.get_path()
         with open(path, "w") as outfile:
-            json.dump(obj, outfile, indent=4, default=lambda x: str(x))
+            outfile.write(json.dumps(obj, indent=4, default=lambda x: str(x)))
         return path
 
 
 class PickleCacher(Cacheable):
-    """Dumps an object to a pickle file."""
+    """Dumps an object to a pickle file, using the highest pickle protocol available."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, extension=".pkl", **kwargs)
@@ -549,7 +663,7 @@ class PickleCacher(Cacheable):
     def save(self, obj) -> str:
         path = self.get_path()
         with open(path, "wb") as outfile:
-            pickle.dump(obj, outfile)
+            pickle.dump(obj, outfile, protocol=pickle.HIGHEST_PROTOCOL)
         return path
 
 
@@ -559,18 +673,46 @@ class _PandasIOType(Enum):
     parquet = "parquet"
     pickle = "pkl"
     orc = "orc"
+    feather = "feather"
     hdf5 = "h5"
     excel = "xlsx"
     xml = "xml"
 
 
+_PANDAS_READ_FUNCTIONS = {
+    _PandasIOType.csv: "read_csv",
+    _PandasIOType.json: "read_json",
+    _PandasIOType.parquet: "read_parquet",
+    _PandasIOType.pickle: "read_pickle",
+    _PandasIOType.orc: "read_orc",
+    _PandasIOType.feather: "read_feather",
+    _PandasIOType.hdf5: "read_hdf",
+    _PandasIOType.excel: "read_excel",
+    _PandasIOType.xml: "read_xml",
+}
+"""The name of the pandas read function to use for each IO type."""
+
+_PANDAS_TO_FUNCTIONS = {
+    _PandasIOType.csv: "to_csv",
+    _PandasIOType.json: "to_json",
+    _PandasIOType.parquet: "to_parquet",
+    _PandasIOType.pickle: "to_pickle",
+    _PandasIOType.orc: "to_orc",
+    _PandasIOType.feather: "to_feather",
+    _PandasIOType.hdf5: "to_hdf",
+    _PandasIOType.excel: "to_excel",
+    _PandasIOType.xml: "to_xml",
+}
+"""The name of the dataframe write function to use for each IO type."""
+
+
 class PandasCacher(Cacheable):
     """Saves a pandas dataframe to selectable IO format.
 
     Args:
         format (str): Selected pandas IO format. Choices are:
             ("csv", "json", "parquet", "pickle",
-            "orc", "hdf5", "excel", "xml")
+            "orc", "feather", "hdf5", "excel", "xml")
         to_args (Dict): Dictionary of arguments to use in the pandas
             ``to_*()`` call.
         read_args (Dict): Dictionary of arguments to use in the pandas
@@ -581,7 +723,15 @@ class PandasCacher(Cacheable):
         self,
         path_override: Optional[str] = None,
         format: Literal[
-            "csv", "json", "parquet", "pickle", "orc", "hdf5", "excel", "xml"
+            "csv",
+            "json",
+            "parquet",
+            "pickle",
+            "orc",
+            "feather",
+            "hdf5",
+            "excel",
+            "xml",
         ] = "pickle",
         to_args: Optional[dict] = None,
         read_args: Optional[dict] = None,
@@ -625,25 +775,12 @@ class PandasCacher(Cacheable):
     # for reading.
 
     def load(self):
+        import pandas as pd
+
         # select the appropriate pandas read function based on format
-        if self.format == _PandasIOType.csv:
-            pandas_read = pd.read_csv
-        elif self.format == _PandasIOType.json:
-            pandas_read = pd.read_json
-        elif self.format == _PandasIOType.parquet:
-            pandas_read = pd.read_parquet
-        elif self.format == _PandasIOType.pickle:
-            pandas_read = pd.read_pickle
-        elif self.format == _PandasIOType.orc:
-            pandas_read = pd.read_orc
-        elif self.format == _PandasIOType.hdf5:
-            pandas_read = pd.read_hdf
-        elif self.format == _PandasIOType.excel:
-            pandas_read = pd.read_excel
-        elif self.format == _PandasIOType.xml:
-            pandas_read = pd.read_xml
-        else:
+        if self.format not in _PANDAS_READ_FUNCTIONS:
             raise RuntimeError(f"Invalid Pandas IO Type ({self.format.name}) selected")
+        pandas_read = getattr(pd, _PANDAS_READ_FUNCTIONS[self.format])
 
         # double check that there's no pandas version mismatch
         # at some point it may be worth warning only on major/minor version difference
@@ -651,32 +788,20 @@ class PandasCacher(Cacheable):
         if "pandas_version" in self.extra_metadata:
             if self.extra_metadata["pandas_version"] != pd.__version__:
                 logging.warning(
-                    "Attempting to use pandas v%s to load a dataframe that was initially saved with pandas v%s"
-                    % (pd.__version__, self.extra_metadata["pandas_version"])
+                    "Attempting to use pandas v%s to load a dataframe that was initially saved with pandas v%s",
+                    pd.__version__,
+                    self.extra_metadata["pandas_version"],
                 )
 
         return pandas_read(self.get_path(), **self.read_args)
 
-    def save(self, obj: pd.DataFrame) -> str:
+    def save(self, obj: "pd.DataFrame") -> str:
+        import pandas as pd
+
         # select appropriate pandas write function based on format
-        if self.format == _PandasIOType.csv:
-            pandas_to = obj.to_csv
-        elif self.format == _PandasIOType.json:
-            pandas_to = obj.to_json
-        elif self.format == _PandasIOType.parquet:
-            pandas_to = obj.to_parquet
-        elif self.format == _PandasIOType.pickle:
-            pandas_to = obj.to_pickle
-        elif self.format == _PandasIOType.orc:
-            pandas_to = obj.to_orc
-        elif self.format == _PandasIOType.hdf5:
-            pandas_to = obj.to_hdf
-        elif self.format == _PandasIOType.excel:
-            pandas_to = obj.to_excel
-        elif self.format == _PandasIOType.xml:
-            pandas_to = obj.to_xml
-        else:
+        if self.format not in _PANDAS_TO_FUNCTIONS:
             raise RuntimeError(f"Invalid Pandas IO Type ({self.format.name}) selected")
+        pandas_to = getattr(obj, _PANDAS_TO_FUNCTIONS[self.format])
         # record relevant cacher information to help track down any issues if they arise
         self.extra_metadata["pandas_version"] = pd.__version__
         self.extra_metadata["to_args"] = self.to_args
@@ -805,7 +930,7 @@ class FileReferenceCacher(Cacheable):
 
         if type(files) == list:
             for file in files:
-                logging.debug("Checking from file list: '%s'" % file)
+                logging.debug("Checking from file list: '%s'", file)
                 if not os.path.exists(file):
                     return False
         else:
@@ -822,7 +947,7 @@ class FileReferenceCacher(Cacheable):
     def save(self, files: Union[list[str], str]) -> str:
         path = self.get_path()
         with open(path, "w") as outfile:
-            json.dump(files, outfile, indent=4)
+            outfile.write(json.dumps(files, indent=4))
         return path
 
 
@@ -9,8 +9,6 @@ This file contains a ``__name__ == "__main__"`` and can be run directly.
 
 import argparse
 
-import argcomplete
-
 
 def completer_experiments(**kwargs) -> list[str]:
     """Argcomplete experiment name completer. This is done by grepping
@@ -183,12 +181,11 @@ def cmd_ls():
     from curifactory.experiment import list_experiments, list_params
 
     sys.path.append(os.getcwd())
-    print("EXPERIMENTS:")
-    for experiment in list_experiments():
-        print("\t" + experiment)
-    print("\nPARAMS:")
-    for param in list_params():
-        print("\t" + param)
+    lines = ["EXPERIMENTS:"]
+    lines.extend("\t" + experiment for experiment in list_experiments())
+    lines.append("\nPARAMS:")
+    lines.extend("\t" + param for param in list_params())
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_reports(args):
@@ -470,7 +467,14 @@ Examples:
         action="store_true",
         help="Only used for 'experiment reports', updates the report index with all exisiting reports in the reports file. This is to handle if you pull in reports from other machines.",
     )
-    argcomplete.autocomplete(parser, always_complete_options=False)
+    # NOTE: argcomplete only does anything when run from the shell completion hook,
+    # which sets _ARGCOMPLETE, so only import it (lazily) in that case
+    import os
+
+    if "_ARGCOMPLETE" in os.environ:
+        import argcomplete
+
+        argcomplete.autocomplete(parser, always_complete_options=False)
 
     args = parser.parse_args()
 
@@ -30,6 +30,8 @@ class ExecutionNode:
         stage_name (str): The name of the stage that would execute.
     """
 
+    __slots__ = ("record", "stage_name", "parent", "dependencies")
+
     def __init__(self, record: Record, stage_name: str):
         self.record = record
         self.stage_name = stage_name
@@ -87,55 +89,86 @@ class DAG:
         """This is the list of ExecutionNode individual (non-recursive) string
         representations: ``(RECORD_ID, STAGE_NAME)``"""
 
+        self.execution_set: set[tuple[int, str]] = set()
+        """The same representations as ``execution_list``, as a set for quickly
+        checking whether a given stage needs to execute."""
+
         self.execution_trees: list[ExecutionNode] = []
         """The set of node execution trees - each node here is a "leaf stage", or
         stage with no outputs that other stages depend on. This is essentially the
         inverted tree, because stage "leafs" will each be a root of an execution
         tree, where the sub-trees are all the dependencies required for it to run."""
 
+        self._child_records_index: dict[Record, list[Record]] = None
+        """Mapping of each record to the records that use it as an input record, only
+        populated while ``analyze`` runs, see ``child_records``."""
+
     def analyze(self):
         """Construct execution trees and execution list."""
-        self.build_execution_trees()
-        self.determine_execution_list()
+        # child_records gets called for every output of every stage while finding
+        # leaves, so build the full parent -> children mapping once up front. It's
+        # dropped afterwards so later changes to any input records aren't missed.
+        self._child_records_index = self._build_child_records_index()
+        try:
+            self.build_execution_trees()
+            self.determine_execution_list()
+        finally:
+            self._child_records_index = None
+
+    def _build_child_records_index(self) -> dict[Record, list[Record]]:
+        """Map each record to the records that use it as an input record."""
+        index = {}
+        for other_record in self.records:
+            for input_record in other_record.input_records:
+                children = index.setdefault(input_record, [])
+                if len(children) == 0 or children[-1] is not other_record:
+                    children.append(other_record)
+        return index
 
     def get_record_string(self, record_index: int) -> str:
         """Get a string representation for the given record. This collects
         all of the associated stages, inputs and outputs for each, and cache
         status for each artifact."""
         record = self.records[record_index]
-        output = (
+        # collect the pieces and join once at the end rather than repeatedly
+        # re-allocating the growing string
+        output = [
             f"==== {record.get_reference_name(True)} hash: {record.get_hash()} ===="
-        )
+        ]
         for index, stage in enumerate(record.stages):
-            output += "\nStage: " + stage
+            output.append("\nStage: " + stage)
             if self.is_leaf(record, stage):
-                output += " (leaf)"
+                output.append(" (leaf)")
             if len(record.input_records) > 0:
-                output += "\n\tInput records:"
+                output.append("\n\tInput records:")
                 for input_record in record.input_records:
-                    output += f"\n\t\t{input_record.get_reference_name(True)}"
+                    output.append(f"\n\t\t{input_record.get_reference_name(True)}")
             if len(record.stage_inputs[index]) > 0:
-                output += "\n\tInputs:"
+                output.append("\n\tInputs:")
                 for stage_input_index in record.stage_inputs[index]:
                     if stage_input_index != -1:
                         stage_input = self.artifacts[stage_input_index]
-                        output += f"\n\t\t{stage_input.name}"
+                        output.append(f"\n\t\t{stage_input.name}")
                         if stage_input.cached:
-                            output += f" (cached) [{stage_input.metadata['manager_run_info']['reference']}]"
+                            output.append(
+                                f" (cached) [{stage_input.metadata['manager_run_info']['reference']}]"
+                            )
             if len(record.stage_outputs[index]) > 0:
-                output += "\n\tOutputs:"
+                output.append("\n\tOutputs:")
                 for stage_output_index in record.stage_outputs[index]:
                     stage_output = self.artifacts[stage_output_index]
-                    output += f"\n\t\t{stage_output.name}"
+                    output.append(f"\n\t\t{stage_output.name}")
                     if stage_output.cached:
-                        output += f" (cached) [{stage_output.metadata['manager_run_info']['reference']}]"
-        return output
+                        output.append(
+                            f" (cached) [{stage_output.metadata['manager_run_info']['reference']}]"
+                        )
+        return "".join(output)
 
     def print_experiment_map(self):
         """Print the representations for each record."""
-        string = ""
-        for index, record in enumerate(self.records):
-            string += self.get_record_string(index) + "\n"
+        string = "".join(
+            self.get_record_string(index) + "\n" for index in range(len(self.records))
+        )
         print(string)
 
     def is_leaf(self, record: Record, stage_name: str) -> bool:
@@ -163,30 +196,38 @@ class DAG:
         self, record: Record, stage_search_start_index: int, output: str
     ) -> bool:
         """Check if the specified output is used as input in any stage."""
-        # Iterate each following stage in that record and see if the requested output
-        # is in any of the inputs
-        # TODO: instead of checking by name, we should be checking by the artifact id
-        for i in range(stage_search_start_index, len(record.stages)):
-            # NOTE: this works for both stages _and_ aggregates because expected_state
-            # reps for aggregates get added to record.stage_inputs in the aggregate decorator
-            for stage_input_index in record.stage_inputs[i]:
-                stage_input = self.artifacts[stage_input_index]
-                if stage_input.name == output:
-                    return True
-
-        # check if any following records directly use the output in a stage or aggregate
-        children = self.child_records(record)
-        for child in children:
-            # check if we're directly using it in a normal stage
-            explicitly_used = self.is_output_used_anywhere(child, 0, output)
-            if explicitly_used:
-                return True
+        # this walks the chain of child records iteratively, keeping track of which
+        # records have already been checked so that records reachable through multiple
+        # parents (e.g. aggregates over copies) are only searched once.
+        to_search = [(record, stage_search_start_index)]
+        searched = set()
+        while len(to_search) > 0:
+            search_record, start_index = to_search.pop()
+
+            # Iterate each following stage in that record and see if the requested output
+            # is in any of the inputs
+            # TODO: instead of checking by name, we should be checking by the artifact id
+            for i in range(start_index, len(search_record.stages)):
+                # NOTE: this works for both stages _and_ aggregates because expected_state
+                # reps for aggregates get added to record.stage_inputs in the aggregate decorator
+                for stage_input_index in search_record.stage_inputs[i]:
+                    stage_input = self.artifacts[stage_input_index]
+                    if stage_input.name == output:
+                        return True
+
+            # check if any following records directly use the output in a stage or aggregate
+            for child in self.child_records(search_record):
+                if child not in searched:
+                    searched.add(child)
+                    to_search.append((child, 0))
 
         return False
 
     def child_records(self, record: Record) -> list[Record]:
         """Return a list of all records for which the provided record is an input record.
         (This occurs when calling ``record.make_copy()`` and for aggregates.)"""
+        if self._child_records_index is not None:
+            return list(self._child_records_index.get(record, []))
         children = [
             other_record
             for other_record in self.records
@@ -275,6 +316,7 @@ class DAG:
     def determine_execution_list(self):
         """I've got them on the list, they'll none of them be missed."""
         self.execution_list = []
+        self.execution_set = set()
         for node in self.execution_trees:
             self.determine_execution_list_recursive(node, False)
 
@@ -339,8 +381,10 @@ class DAG:
         # through its dependencies to see if _those_ need to execute as well.)
 
         # need to execute, off with its head!
-        if node.chain_rep() not in self.execution_list:
-            self.execution_list.insert(0, node.chain_rep())
+        chain_rep = node.chain_rep()
+        if chain_rep not in self.execution_set:
+            self.execution_list.insert(0, chain_rep)
+            self.execution_set.add(chain_rep)
             # NOTE: for some weird reason in how I have this structured, if an overwrite stage
             # is found, the ordering of the execution list is in reverse of what it's supposed to be.
             # For right now that doesn't really matter, but if we ever get fancy with using the DAG
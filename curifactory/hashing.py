@@ -32,6 +32,7 @@ import json
 import os
 from copy import deepcopy
 from dataclasses import field, fields, is_dataclass
+from functools import cache
 from typing import Any, Callable, Union
 
 PARAMETERS_BLACKLIST = ["name", "hash", "overwrite", "hash_representations"]
@@ -164,6 +165,13 @@ def get_parameter_hash_value(param_set, param_name: str) -> tuple[str, Any]:
     return (f"repr({param_name})", repr(value))
 
 
+@cache
+def _field_names(param_set_type: type) -> tuple[str, ...]:
+    """The dataclass field names of a parameter set class. ``fields()`` rebuilds its
+    tuple on every call, and the same few classes get hashed repeatedly."""
+    return tuple(param.name for param in fields(param_set_type))
+
+
 def get_param_set_hash_values(param_set) -> dict[str, tuple[str, Any]]:
     """Collect the hash representations from every parameter in the passed parameter set.
 
@@ -175,8 +183,8 @@ def get_param_set_hash_values(param_set) -> dict[str, tuple[str, Any]]:
     """
     # TODO: raise_error if param_set is not a dataclass?
     return {
-        param.name: get_parameter_hash_value(param_set, param.name)
-        for param in fields(param_set)
+        name: get_parameter_hash_value(param_set, name)
+        for name in _field_names(type(param_set))
     }
 
 
@@ -193,8 +201,8 @@ def _compute_hash_part(hash_representations: dict[str, tuple[str, Any]]) -> int:
         else:
             # Note that we concatenate the string of the value with the hash key, otherwise if two parameters had eachother's
             # values in another parameter set, they'd compute the same hash which is decidedly not correct.
-            hash_hex = hashlib.md5(f"{hash_key}{hash_rep_value}".encode()).hexdigest()
-            hash_total += int(hash_hex, 16)
+            hash_digest = hashlib.md5(f"{hash_key}{hash_rep_value}".encode()).digest()
+            hash_total += int.from_bytes(hash_digest, "big")
     return hash_total
 
 
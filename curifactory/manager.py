@@ -293,9 +293,10 @@ class ArtifactManager:
         # inside previous loop because we have to add references to
         # the corresponding mapped_record instances rather than the
         # self.records instances which are about to be deleted)
+        record_indices = {id(record): i for i, record in enumerate(self.records)}
         for i, record in enumerate(self.records):
             for input_record in record.input_records:
-                input_record_index = self.records.index(input_record)
+                input_record_index = record_indices[id(input_record)]
                 self.map.records[i].input_records.append(
                     self.map.records[input_record_index]
                 )
@@ -321,23 +322,20 @@ class ArtifactManager:
             # record.
             taskid = -1
             record_name = record.get_reference_name()
-            # name = record.args.name if record.args is not None else "None"
-            # record_hash = record.get_hash()
-            # record_index = -1
-            for i, map_record in enumerate(self.map.records):
-                # map_record_hash = map_record.get_hash()
-                # map_name = (
-                #     map_record.params.name if map_record.params is not None else "None"
-                # )
-                # if map_record_hash == record_hash:
+            # reference names include the record index, so the only map record
+            # that can match is the one at the same index - check it directly
+            # rather than building the reference name of every map record.
+            record_index = record.get_record_index()
+            if 0 <= record_index < len(self.map.records):
+                map_record = self.map.records[record_index]
                 if map_record.get_reference_name(True) == record_name:
                     taskid = map_record.taskid
-                    # record_index = i
 
             map_task = None
             for task in self.map_progress.tasks:
                 if task.id == taskid:
                     map_task = task
+                    break
 
             # continue is called when a stage/aggregate is complete and about to
             # return
@@ -431,12 +429,12 @@ class ArtifactManager:
         """This is important to get parameter sets that aren't obtained through parameter files
         , e.g. in an interactive session."""
         master_list = []
-        found_hashes = []  # track which parameter sets we've already added by hash
+        found_hashes = set()  # track which parameter sets we've already added by hash
         for record in self.records:
             if record.params is not None:
                 if record.params.hash not in found_hashes:
                     master_list.append(record.params)
-                    found_hashes.append(record.params.hash)
+                    found_hashes.add(record.params.hash)
 
         return master_list
 
@@ -792,7 +790,9 @@ class ArtifactManager:
 
     def get_reportable_groups(self) -> list[str]:
         groups = []
+        found_groups = set()
         for reportable in self.reportables:
-            if reportable.group not in groups:
+            if reportable.group not in found_groups:
                 groups.append(reportable.group)
+                found_groups.add(reportable.group)
         return groups
@@ -22,12 +22,12 @@ class CacheAwareDict(dict):
         we make state access before determining if stage execution is required or not."""
 
     def __getitem__(self, key):
-        item = super().__getitem__(key)
-        if type(item) == Lazy and self.resolve and item.resolve:
-            logging.debug("Auto-resolving lazy object '%s'..." % key)
+        item = dict.__getitem__(self, key)
+        # most state entries aren't lazy, so check the cheap identity test first
+        if type(item) is Lazy and self.resolve and item.resolve:
+            logging.debug("Auto-resolving lazy object '%s'...", key)
             return item.cacher.load()
-        else:
-            return item
+        return item
 
 
 # TODO: make printing this dump the state out as a string
@@ -94,12 +94,26 @@ class Record:
         passed to the artifact manager's ``get_artifact_path`` function:
         (obj_name, subdir, prefix, and path)
         """
+        self._unstored_tracked_keys: set[tuple] = set()
+        """The ``(obj_name, subdir, prefix, path)`` of each entry in ``unstored_tracked_paths``,
+        so repeated ``get_path`` calls for the same path don't keep appending it."""
         self.stored_paths: list[str] = []
         """A list of paths that have been copied into a full store folder. These are
         the source paths, not the destination paths."""
+        self._stored_paths_set: set[str] = set()
+        """Set mirror of ``stored_paths`` so the per-path "already stored" check
+        in ``store_tracked_paths`` doesn't scan the whole list."""
         self.stage_cachers: list = None
         """A list of the initialized cachers set for the current stage, if any. This is so that a stage
         can get access to output path information if it needs."""
+        self._params_string_reps = None
+        """Cached result of ``hashing.param_set_string_hash_representations`` for
+        ``params``, see ``get_params_string_reps``."""
+        self._params_string_reps_source = None
+        """The parameter set instance ``_params_string_reps`` was computed from."""
+        self._record_index_cache: dict[bool, int] = {}
+        """Last known index of this record in the manager's (``False``) and the map's
+        (``True``) record lists, see ``get_record_index``."""
 
         self.set_hash()
         if not hide:
@@ -118,7 +132,7 @@ class Record:
 
                 # don't duplicate if we've already stored it (this might occur from multiple get_path
                 # calls on a cacher)
-                if path in self.stored_paths:
+                if path in self._stored_paths_set:
                     continue
 
                 # paths can get added to the list that don't exist from a cacher's check() call
@@ -136,7 +150,7 @@ class Record:
                 store_path = self.manager.get_artifact_path(
                     name, record=self, subdir=subdir, prefix=prefix, store=True
                 )
-                logging.debug(f"Copying tracked path '{path}' to '{store_path}'...")
+                logging.debug("Copying tracked path '%s' to '%s'...", path, store_path)
                 if os.path.isdir(path):
                     shutil.copytree(path, store_path)
                 else:
@@ -144,11 +158,23 @@ class Record:
 
                 # remember that we copied this path
                 self.stored_paths.append(path)
+                self._stored_paths_set.add(path)
         # I'm clearing unstored regardless of store full or not, because we may
         # eventually want to support something like --store-artifact, where we
         # selectively add specific things to the tracked paths, so we want tracked
         # paths to not build up things that are never going to be stored.
         self.unstored_tracked_paths = []
+        self._unstored_tracked_keys = set()
+
+    def _track_path(self, obj_name: str, subdir: str, prefix: str, path: str):
+        """Add a path to ``unstored_tracked_paths`` if it isn't already listed."""
+        key = (obj_name, subdir, prefix, path)
+        if key in self._unstored_tracked_keys:
+            return
+        self._unstored_tracked_keys.add(key)
+        self.unstored_tracked_paths.append(
+            dict(obj_name=obj_name, subdir=subdir, prefix=prefix, path=path)
+        )
 
     def set_hash(self):
         """Establish the hash for the current parameter set (and set it on the parameter set instance)."""
@@ -180,6 +206,23 @@ class Record:
         else:
             return "None"
 
+    def get_params_string_reps(self) -> dict:
+        """Returns the json-dumpable hash representations of this record's parameter set
+        (see ``hashing.param_set_string_hash_representations``.)
+
+        Every cacher's metadata includes these, so they're computed once per parameter
+        set rather than once per saved artifact. The returned dictionary is shared and
+        should not be modified.
+        """
+        if self.params is None:
+            return None
+        if self._params_string_reps_source is not self.params:
+            self._params_string_reps = hashing.param_set_string_hash_representations(
+                self.params
+            )
+            self._params_string_reps_source = self.params
+        return self._params_string_reps
+
     def set_aggregate(self, aggregate_records):
         """Mark this record as starting with an aggregate stage, meaning the hash of all cached outputs produced
         within this record need to reflect the combo hash of all records going into it.
@@ -296,9 +339,7 @@ class Record:
             # TODO: (3/22/2023) do I need to also be storing stage name? These are always supposed
             # to be handled from the current stage only anyway, so the stage name should always
             # be the last one
-            self.unstored_tracked_paths.append(
-                dict(obj_name=obj_name, subdir=subdir, prefix=prefix, path=path)
-            )
+            self._track_path(obj_name, subdir, prefix, path)
         return path
 
     def get_dir(
@@ -334,14 +375,7 @@ class Record:
             stage_name=stage_name,
         )
         if track:
-            self.unstored_tracked_paths.append(
-                dict(
-                    obj_name=dir_name_suffix,
-                    subdir=subdir,
-                    prefix=prefix,
-                    path=dir_path,
-                )
-            )
+            self._track_path(dir_name_suffix, subdir, prefix, dir_path)
 
         os.makedirs(dir_path, exist_ok=True)
         return dir_path
@@ -360,13 +394,25 @@ class Record:
             record_list = self.manager.map.records
         else:
             record_list = self.manager.records
+        # records are only ever appended, so the last found index is almost always still
+        # correct - verify it before falling back to a full scan.
+        index = self._record_index_cache.get(map)
+        if (
+            index is not None
+            and index < len(record_list)
+            and record_list[index] is self
+        ):
+            return index
         for i, record in enumerate(record_list):
             if self == record:
+                self._record_index_cache[map] = i
                 return i
         return -1
 
 
 class MapArtifactRepresentation:
+    __slots__ = ("record_index", "stage_name", "name", "cached", "metadata", "cacher")
+
     def __init__(
         self,
         record_index: int,
@@ -401,6 +447,8 @@ class ArtifactRepresentation:
         artifact: The artifact itself.
     """
 
+    __slots__ = ("init_record", "name", "string", "cacher", "metadata", "file")
+
     def __init__(self, record, name, artifact, metadata=None, cacher=None):
         # TODO: (3/21/2023) possibly have "files" which would be cachers.cached_files?
         self.init_record = record
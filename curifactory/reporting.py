@@ -12,16 +12,19 @@ import json
 import logging
 import os
 import shutil
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
 from graphviz import Digraph
 from graphviz.backend import ExecutableNotFound
 
 from curifactory import hashing, utils
 
+# NOTE: matplotlib, numpy, and pandas are only needed by specific reporters, and
+# importing them (especially pyplot) is a large part of curifactory's import time,
+# so they're imported where they're used.
+if TYPE_CHECKING:
+    import pandas as pd
+
 COLORS = [
     "darkseagreen2",  # #b4eeb4
     "thistle",
@@ -154,7 +157,9 @@ class LatexTableReporter(Reportable):
         kwargs: Any arguments to pass to `pandas.io.formats.style.Styler.to_latex <https://pandas.pydata.org/docs/reference/api/pandas.io.formats.style.Styler.to_latex.html#pandas.io.formats.style.Styler.to_latex>`_
     """
 
-    def __init__(self, df: pd.DataFrame, name: str = None, group: str = None, **kwargs):
+    def __init__(
+        self, df: "pd.DataFrame", name: str = None, group: str = None, **kwargs
+    ):
         self.df = df
         self.kwargs = kwargs
         super().__init__(name=name, group=group)
@@ -180,7 +185,11 @@ class DFReporter(Reportable):
     """
 
     def __init__(
-        self, df: pd.DataFrame, name: str = None, group: str = None, float_prec: int = 4
+        self,
+        df: "pd.DataFrame",
+        name: str = None,
+        group: str = None,
+        float_prec: int = 4,
     ):
         self.df = df
         self.float_prec = float_prec
@@ -195,6 +204,8 @@ class DFReporter(Reportable):
     #     self.df.to_csv(f"{self.path}{self.name}.csv")
 
     def html(self) -> list[str]:
+        import numpy as np
+
         output = ["<table border='1' cellspacing='0'><tr><th></th>"]
 
         # column row
@@ -364,6 +375,8 @@ class LinePlotReporter(Reportable):
         super().__init__(name=name, group=group)
 
     def render(self):
+        import matplotlib.pyplot as plt
+
         plt.figure(facecolor="white")
 
         # plot the figure
@@ -737,7 +750,27 @@ def run_report(
     return folder_path, graphs_path, reportables_path
 
 
-def _add_record_subgraph(dot, record_index: int, record, manager, detailed=True):
+def _group_artifacts_by_record(manager) -> dict:
+    """Map each record to the list of ``(index, artifact)`` pairs from the manager's
+    artifacts that were created in it."""
+    grouped = {}
+    for index, artifact in enumerate(manager.artifacts):
+        grouped.setdefault(artifact.init_record, []).append((index, artifact))
+    return grouped
+
+
+def _add_record_subgraph(
+    dot, record_index: int, record, manager, detailed=True, record_artifacts=None
+):
+    # when drawing every record, the caller groups the artifacts up front so we
+    # don't scan the full artifact list once per record
+    if record_artifacts is None:
+        record_artifacts = [
+            (index, artifact)
+            for index, artifact in enumerate(manager.artifacts)
+            if artifact.init_record == record
+        ]
+
     with dot.subgraph(name=f"cluster_{record_index}") as c:
         c.attr(color=str(_get_color(record_index)))
         c.attr(style="filled")
@@ -754,48 +787,51 @@ def _add_record_subgraph(dot, record_index: int, record, manager, detailed=True)
             stage_name = f"{record_index}_{stage}"
             c.node(stage_name, stage, style="filled", fillcolor="white", fontsize="12")
 
-        for index, artifact in enumerate(manager.artifacts):
-            if artifact.init_record == record:
-                if detailed:
-                    table = (
-                        "<<table border='0' cellborder='1' cellspacing='0'><tr><td>"
-                        + "<b>"
-                        + str(artifact.name)
-                        + "</b>"
-                        + "</td></tr><tr><td width='0'>"
-                        + artifact.html_safe()
-                        + "</td></tr><tr><td>"
-                        + artifact.file
-                        + "</td></tr></table>>"
-                    )
-                    c.node(
-                        f"a{index}",
-                        table,
-                        shape="none",
-                        fontsize="8",
-                        padding="0",
-                        margin="0",
-                        width="0",
-                    )
-                else:
-                    c.node(
-                        f"a{index}",
-                        str(artifact.name),
-                        shape="rectangle",
-                        fontsize="10",
-                        height=".20",
-                    )
+        for index, artifact in record_artifacts:
+            if detailed:
+                table = (
+                    "<<table border='0' cellborder='1' cellspacing='0'><tr><td>"
+                    + "<b>"
+                    + str(artifact.name)
+                    + "</b>"
+                    + "</td></tr><tr><td width='0'>"
+                    + artifact.html_safe()
+                    + "</td></tr><tr><td>"
+                    + artifact.file
+                    + "</td></tr></table>>"
+                )
+                c.node(
+                    f"a{index}",
+                    table,
+                    shape="none",
+                    fontsize="8",
+                    padding="0",
+                    margin="0",
+                    width="0",
+                )
+            else:
+                c.node(
+                    f"a{index}",
+                    str(artifact.name),
+                    shape="rectangle",
+                    fontsize="10",
+                    height=".20",
+                )
+
+        # collect every artifact index output by this record once, so checking where
+        # each input comes from below doesn't rescan all of the stage outputs
+        record_output_indices = {
+            output_index
+            for output_set in record.stage_outputs
+            for output_index in output_set
+        }
 
         # iterate each stage in this record and connect any input artifacts _to_ the stage
         for index, input_set in enumerate(record.stage_inputs):
             for input_index in input_set:
                 if input_index != -1:
                     # check if the input is from this record or not
-                    found_in_this_record = False
-                    for output_set in record.stage_outputs:
-                        if input_index in output_set:
-                            found_in_this_record = True
-                            break
+                    found_in_this_record = input_index in record_output_indices
                     # don't include if not from this record and a detailed map
                     if detailed and not found_in_this_record:
                         continue
@@ -998,8 +1034,16 @@ def map_full_svg(
     dot.attr(ranksep=".15")
     # dot.attr(rankdir='LR')
 
+    artifacts_by_record = _group_artifacts_by_record(manager)
     for index, record in enumerate(manager.records):
-        _add_record_subgraph(dot, index, record, manager, detailed)
+        _add_record_subgraph(
+            dot,
+            index,
+            record,
+            manager,
+            detailed,
+            record_artifacts=artifacts_by_record.get(record, []),
+        )
 
     # add record connections to any aggregate stages
     # NOTE: (4/6/23) - because of the new expected state stuff, this is
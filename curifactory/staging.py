@@ -225,7 +225,7 @@ def stage(  # noqa: C901 -- TODO: will be difficult to simplify...
                 no_cachers = False
                 for index, output in enumerate(outputs):
                     if type(output) != Lazy:
-                        logging.debug("Forcing lazy cache for '%s'" % output)
+                        logging.debug("Forcing lazy cache for '%s'", output)
                         outputs[index] = Lazy(output)
                         # NOTE: since Lazy caching doesn't work without a cacher, we need to ensure
                         # one if none exists. Pickle is pretty broad, but obviously there are some things
@@ -242,7 +242,7 @@ def stage(  # noqa: C901 -- TODO: will be difficult to simplify...
             elif record.manager.ignore_lazy:
                 for index, output in enumerate(outputs):
                     if type(output) == Lazy:
-                        logging.debug("Disabling lazy cache for '%s'" % output)
+                        logging.debug("Disabling lazy cache for '%s'", output)
                         outputs[index] = output.name
 
             # check for mismatched amounts of cachers
@@ -364,8 +364,8 @@ def stage(  # noqa: C901 -- TODO: will be difficult to simplify...
             # to determine if this stage executes or not.
             if record.manager.map is not None:
                 stage_rep = (record.get_record_index(), name)
-                if stage_rep not in record.manager.map.execution_list:
-                    logging.debug('DAG-indicated stage skip "%s".' % str(stage_rep))
+                if stage_rep not in record.manager.map.execution_set:
+                    logging.debug('DAG-indicated stage skip "%s".', stage_rep)
                     _dag_skip_check_cached_outputs(name, record, outputs, local_cachers)
 
                     # grab any possible previous reportables so they still end up in report.
@@ -480,7 +480,7 @@ def stage(  # noqa: C901 -- TODO: will be difficult to simplify...
             for index, output_name in enumerate(outputs):
                 if type(output_name) == Lazy:
                     lazy_found = True
-                    logging.debug("Lazy object '%s' will be cleaned." % output_name)
+                    logging.debug("Lazy object '%s' will be cleaned.", output_name)
                     if index == 0 and len(outputs) == 1:
                         cleaned_function_outputs = outputs[
                             index
@@ -502,7 +502,7 @@ def stage(  # noqa: C901 -- TODO: will be difficult to simplify...
                 del function_outputs
                 post_del_mem_usage = psutil.Process().memory_info().rss
                 del_mem_diff = pre_del_mem_usage - post_del_mem_usage
-                logging.debug("Freed %s" % utils.human_readable_mem_usage(del_mem_diff))
+                logging.debug("Freed %s", utils.human_readable_mem_usage(del_mem_diff))
 
             logging.info("Stage %s complete", name)
 
@@ -684,7 +684,7 @@ def aggregate(  # noqa: C901 -- TODO: will be difficult to simplify...
                 no_cachers = False
                 for index, output in enumerate(outputs):
                     if type(output) != Lazy:
-                        logging.debug("Forcing lazy cache for '%s'" % output)
+                        logging.debug("Forcing lazy cache for '%s'", output)
                         outputs[index] = Lazy(output)
                         # NOTE: since Lazy caching doesn't work without a cacher, we need to ensure
                         # one if none exists. Pickle is pretty broad, but obviously there are some things
@@ -701,7 +701,7 @@ def aggregate(  # noqa: C901 -- TODO: will be difficult to simplify...
             elif record.manager.ignore_lazy:
                 for index, output in enumerate(outputs):
                     if type(output) == Lazy:
-                        logging.debug("Disabling lazy cache for '%s'" % output)
+                        logging.debug("Disabling lazy cache for '%s'", output)
                         outputs[index] = output.name
 
             # check for mismatched amounts of cachers
@@ -815,8 +815,8 @@ def aggregate(  # noqa: C901 -- TODO: will be difficult to simplify...
             # to determine if this stage executes or not.
             if record.manager.map is not None:
                 stage_rep = (record.get_record_index(), name)
-                if stage_rep not in record.manager.map.execution_list:
-                    logging.debug('DAG-indicated stage skip "%s".' % str(stage_rep))
+                if stage_rep not in record.manager.map.execution_set:
+                    logging.debug('DAG-indicated stage skip "%s".', stage_rep)
                     _dag_skip_check_cached_outputs(
                         name, record, outputs, local_cachers, records
                     )
@@ -931,7 +931,7 @@ def aggregate(  # noqa: C901 -- TODO: will be difficult to simplify...
             for index, output_name in enumerate(outputs):
                 if type(output_name) == Lazy:
                     lazy_found = True
-                    logging.debug("Lazy object '%s' will be cleaned." % output_name)
+                    logging.debug("Lazy object '%s' will be cleaned.", output_name)
                     if index == 0 and len(outputs) == 1:
                         cleaned_function_outputs = outputs[
                             index
@@ -953,7 +953,7 @@ def aggregate(  # noqa: C901 -- TODO: will be difficult to simplify...
                 del function_outputs
                 post_del_mem_usage = psutil.Process().memory_info().rss
                 del_mem_diff = pre_del_mem_usage - post_del_mem_usage
-                logging.debug("Freed %s" % utils.human_readable_mem_usage(del_mem_diff))
+                logging.debug("Freed %s", utils.human_readable_mem_usage(del_mem_diff))
 
             logging.info("Stage (aggregate) %s complete", name)
 
@@ -1034,7 +1034,6 @@ def _dag_skip_check_cached_outputs(
             "Do not use '[]' for cachers. This will always short-circuit because there is nothing that isn't cached."
         )
 
-    skipped_function_outputs = []
     for i, output_name in enumerate(outputs):
         cacher = None
         metadata = None
@@ -1063,7 +1062,6 @@ def _dag_skip_check_cached_outputs(
         # add a skippedoutput instance if it's not a cached value
         if output is None:
             output = SkippedOutput(record, stage_name, artifact)
-        skipped_function_outputs.append(output)
         record.state[str(outputs[i])] = output
 
 
@@ -1178,7 +1176,7 @@ def _check_cached_reportables(stage_name, record, aggregate_records=None) -> boo
         paths = reportables_list_cacher.load()
         for path in paths:
             with open(path, "rb") as infile:
-                logging.debug("Reusing cached reportable '%s'" % path)
+                logging.debug("Reusing cached reportable '%s'", path)
                 reportable = pickle.load(infile)
                 record.report(reportable)
         return True
@@ -1214,7 +1212,7 @@ def _store_reportables(stage_name, record, aggregate_records=None):
             reportables_path, f"{reportable.qualified_name}.pkl"
         )
         paths.append(reportable_path)
-        logging.debug("Caching reportable '%s'" % reportable_path)
+        logging.debug("Caching reportable '%s'", reportable_path)
         with open(reportable_path, "wb") as outfile:
             pickle.dump(reportable_copy, outfile)
 
@@ -1244,7 +1242,7 @@ def _store_outputs(
         return
 
     if cachers is not None:
-        logging.info("Stage %s caching outputs..." % function_name)
+        logging.info("Stage %s caching outputs...", function_name)
 
     if type(function_outputs) != tuple:
         function_outputs = (function_outputs,)
@@ -1270,19 +1268,21 @@ def _store_outputs(
             and not record.manager.dry
             and not record.manager.dry_cache
         ):
-            logging.debug(
-                f"Caching {outputs[index]} to '{cachers[index].get_path()}'..."
-            )
-            cachers[index].save(output)
-            artifact.file = cachers[index].get_path()
-            artifact.cacher = cachers[index]
+            cacher = cachers[index]
+            # resolve the path once, get_path re-resolves any template and
+            # re-registers the tracked path on every call
+            cache_path = cacher.get_path()
+            logging.debug("Caching %s to '%s'...", outputs[index], cache_path)
+            cacher.save(output)
+            artifact.file = cache_path
+            artifact.cacher = cacher
 
             # generate and save metadata
             # note that if we got to this point, we actually ran the stage code, so
             # we generate _new_ metadata
-            cachers[index].collect_metadata()
-            cachers[index].metadata["preview"] = artifact.string
-            metadata = cachers[index].save_metadata()
+            cacher.collect_metadata()
+            cacher.metadata["preview"] = artifact.string
+            metadata = cacher.save_metadata()
             artifact.metadata = metadata
 
         # if specified as lazy, be sure to populate the cacher
@@ -24,6 +24,11 @@ EDITORS = ["vim", "nvim", "emacs", "nano", "vi"]
 
 OBJECT_PREVIEW_STRING_LENGTH = 30
 
+LAZILY_IMPORTED_LOGGERS = ["matplotlib", "PIL", "fontTools", "numexpr", "concurrent"]
+"""Loggers of libraries curifactory only imports on first use (matplotlib for plot
+reporters, pandas and its numexpr backend for the pandas cachers), which ``init_logging``
+quiets to warnings (they may not exist yet when non-curifactory loggers are disabled.)"""
+
 
 def get_configuration() -> dict[str, str]:
     """Load the configuration file if available, with defaults for any
@@ -448,6 +453,11 @@ def init_logging(
     if disable_non_cf_loggers:
         for name, logger in logging.root.manager.loggerDict.items():
             logger.disabled = True
+        # some noisy libraries are only imported lazily when first needed (e.g.
+        # matplotlib for plot reporters), so their loggers may not exist yet to
+        # be disabled above - quiet them down ahead of time instead.
+        for name in LAZILY_IMPORTED_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
 
     # sys.stdout = StreamToLogger(logging.INFO)
     if log_errors:
@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import shutil
 import sys
 from dataclasses import dataclass
 from test.examples.stages.cache_stages import (
@@ -766,7 +768,8 @@ def test_pandas_json_cacher_with_df_no_recursion_error(configured_test_manager):
 
 
 @pytest.mark.parametrize(
-    "io_format", ["csv", "json", "parquet", "pickle", "orc", "hdf5", "excel", "xml"]
+    "io_format",
+    ["csv", "json", "parquet", "pickle", "orc", "feather", "hdf5", "excel", "xml"],
 )
 def test_pandas_cacher_for_all_io_formats(configured_test_manager, io_format):
     """The PandasCacher should work for save and load for all IO formats."""
@@ -812,6 +815,7 @@ def test_pandas_cacher_for_all_io_formats(configured_test_manager, io_format):
         ("parquet", {}, {"dtype_backend": "pyarrow"}),
         ("pickle", {}, {}),
         ("orc", {}, {"dtype_backend": "pyarrow"}),
+        ("feather", {}, {"dtype_backend": "pyarrow"}),
         ("excel", {}, {"index_col": 0, "dtype_backend": "pyarrow"}),
         ("xml", {"index": False}, {"dtype_backend": "pyarrow"}),
     ]
@@ -1575,3 +1579,140 @@ def test_extra_metadata_should_be_used_even_if_metadata_set(configured_test_mana
         ).load()
         == "testing"
     )
+
+
+def test_cacher_deepcopy_does_not_copy_record(configured_test_manager):
+    """Deep copying a cacher should give an independent cacher that still references the
+    same record."""
+    record = cf.Record(configured_test_manager, cf.ExperimentParameters(name="test"))
+    cacher = JsonCacher(name="thing", record=record)
+    cacher.extra_metadata["key"] = "value"
+
+    clone = copy.deepcopy(cacher)
+    assert clone is not cacher
+    assert clone.record is record
+    assert clone.extra_metadata == {"key": "value"}
+    clone.extra_metadata["key"] = "other"
+    assert cacher.extra_metadata["key"] == "value"
+
+
+def test_json_cacher_loads_nan(configured_test_manager):
+    """A json cacher should still be able to load non-strict json values (like NaN)
+    that the standard library writes, regardless of json backend."""
+    cacher = JsonCacher(path_override=f"{configured_test_manager.cache_path}/nan.json")
+    cacher.save({"value": float("nan"), "other": 1})
+    loaded = cacher.load()
+    assert np.isnan(loaded["value"])
+    assert loaded["other"] == 1
+
+
+def test_json_cacher_round_trips_large_ints(configured_test_manager):
+    """Integers too large for 64 bits should load back as the exact same int."""
+    cacher = JsonCacher(path_override=f"{configured_test_manager.cache_path}/big.json")
+    cacher.save({"id": 2**70, "negative": -(2**70)})
+    loaded = cacher.load()
+    assert loaded == {"id": 2**70, "negative": -(2**70)}
+    assert type(loaded["id"]) is int
+
+
+def test_load_metadata_reuses_parsed_metadata(configured_test_manager, mocker):
+    """Loading the same unchanged metadata file more than once should only parse it once,
+    but a changed file should be re-parsed."""
+    cacher = JsonCacher(
+        path_override=f"{configured_test_manager.cache_path}/thing.json"
+    )
+    cacher.extra_metadata["number"] = 1
+    cacher.save_metadata()
+
+    spy = mocker.spy(cf.caching.json, "load")
+    assert cacher.load_metadata()["extra"]["number"] == 1
+    assert cacher.load_metadata()["extra"]["number"] == 1
+    assert spy.call_count == 1
+
+    cacher.extra_metadata["number"] = 200
+    cacher.save_metadata()
+    assert cacher.load_metadata()["extra"]["number"] == 200
+    assert spy.call_count == 2
+
+
+def test_load_metadata_reparses_replaced_file_with_same_mtime(configured_test_manager):
+    """A metadata file swapped in with the same size and mtime (e.g. on a filesystem
+    with coarse timestamps) should still be re-parsed, and a reused parse should still
+    reset extra_metadata."""
+    cacher = JsonCacher(
+        path_override=f"{configured_test_manager.cache_path}/thing.json"
+    )
+    cacher.extra_metadata["number"] = 1
+    cacher.save_metadata()
+    metadata_path = cacher.get_path("_metadata.json")
+    assert cacher.load_metadata()["extra"]["number"] == 1
+
+    cacher.extra_metadata = {}
+    cacher.load_metadata()
+    assert cacher.extra_metadata == {"number": 1}
+
+    stat = os.stat(metadata_path)
+    with open(f"{metadata_path}.other", "w") as outfile:
+        json.dump(dict(extra=dict(number=2)), outfile, indent=2)
+    os.utime(f"{metadata_path}.other", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(f"{metadata_path}.other", metadata_path)
+    assert os.stat(metadata_path).st_size == stat.st_size
+    assert cacher.load_metadata()["extra"]["number"] == 2
+
+
+def test_save_metadata_skips_unchanged_write(configured_test_manager, mocker):
+    """Saving identical metadata to an untouched file shouldn't rewrite it, but changed
+    contents or a removed file should."""
+    cacher = JsonCacher(
+        path_override=f"{configured_test_manager.cache_path}/thing.json"
+    )
+    cacher.extra_metadata["number"] = 1
+    cacher.save_metadata()
+
+    spy = mocker.spy(cf.caching.os, "replace")
+    cacher.save_metadata()
+    assert spy.call_count == 0
+
+    cacher.extra_metadata["number"] = 2
+    cacher.save_metadata()
+    assert spy.call_count == 1
+
+    os.remove(cacher.get_path("_metadata.json"))
+    cacher.save_metadata()
+    assert spy.call_count == 2
+    assert cacher.load_metadata()["extra"]["number"] == 2
+
+    # another process swapping in a file with the same size and mtime should still
+    # get overwritten
+    metadata_path = cacher.get_path("_metadata.json")
+    stat = os.stat(metadata_path)
+    with open(f"{metadata_path}.other", "w") as outfile:
+        json.dump(dict(extra=dict(number=3)), outfile, indent=2)
+    os.utime(f"{metadata_path}.other", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(f"{metadata_path}.other", metadata_path)
+    cacher.save_metadata()
+    with open(metadata_path) as infile:
+        assert json.load(infile)["extra"]["number"] == 2
+
+
+def test_save_metadata_failed_write_removes_temp_file(configured_test_manager, mocker):
+    """If writing the metadata fails, the temporary file shouldn't be left in the cache."""
+    cacher = JsonCacher(
+        path_override=f"{configured_test_manager.cache_path}/thing.json"
+    )
+    cacher.extra_metadata["number"] = 1
+    mocker.patch.object(cf.caching.os, "replace", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        cacher.save_metadata()
+    assert os.listdir(configured_test_manager.cache_path) == []
+
+
+def test_cacher_save_recreates_removed_subdir(configured_test_manager):
+    """Removing a cache subdirectory while the manager is alive shouldn't break later saves."""
+    record = cf.Record(configured_test_manager, cf.ExperimentParameters(name="test"))
+    cacher = JsonCacher(name="thing", subdir="sub", record=record)
+    cacher.save({"a": 1})
+
+    shutil.rmtree(os.path.join(configured_test_manager.cache_path, "sub"))
+    cacher.save({"a": 2})
+    assert cacher.load() == {"a": 2}
@@ -45,6 +45,24 @@ def test_child_records_after_make_copy(configured_test_manager):
     assert r0_children[0] == r1
 
 
+def test_child_records_reflects_input_record_changes(configured_test_manager):
+    """Changing a record's input records after a child_records call should be reflected
+    in the next call."""
+    configured_test_manager.map_mode = True
+    r0 = cf.Record(configured_test_manager, cf.ExperimentParameters("test0"))
+    r1 = cf.Record(configured_test_manager, cf.ExperimentParameters("test1"))
+
+    configured_test_manager.map_mode = False
+    configured_test_manager.map_records()
+    dag = configured_test_manager.map
+
+    r0 = dag.records[0]
+    r1 = dag.records[1]
+    assert len(dag.child_records(r0)) == 0
+    r1.input_records = [r0]
+    assert dag.child_records(r0) == [r1]
+
+
 def test_output_used_check_when_no_following_stages(configured_test_manager):
     """is_output_used_anywhere should return false when there are no following stages or
     records."""
@@ -175,3 +175,37 @@ def test_record_has_access_to_cachers_in_stage(configured_test_manager):
     r0 = do_things(r0)
     assert r0.state["test1"] == "test/examples/data/cache/test_0_do_things_test1.json"
     assert r0.state["test2"] == "test/examples/data/cache/wat_0_do_things_test2.json"
+
+
+def test_record_params_string_reps_computed_once(
+    configured_test_manager, mocker  # noqa: F811
+):
+    """Multiple cachers collecting metadata on the same record should only compute the
+    parameter set string representations once."""
+    spy = mocker.spy(hashing, "param_set_string_hash_representations")
+    record = Record(configured_test_manager, ExperimentParameters(name="testing"))
+    spy.reset_mock()
+
+    reps = record.get_params_string_reps()
+    assert reps["name"] == "testing"
+    assert record.get_params_string_reps() is reps
+    assert spy.call_count == 1
+
+
+def test_record_get_path_tracks_each_path_once(configured_test_manager):
+    """Calling get_path for the same object multiple times should only track the path
+    once, and tracking should start over after the paths are stored."""
+    record = Record(configured_test_manager, ExperimentParameters(name="testing"))
+    path = record.get_path("thing.json")
+    record.get_path("thing.json")
+    record.get_path("thing.json", track=False)
+    record.get_path("other.json")
+    assert [info["path"] for info in record.unstored_tracked_paths] == [
+        path,
+        record.get_path("other.json"),
+    ]
+
+    record.store_tracked_paths()
+    assert record.unstored_tracked_paths == []
+    record.get_path("thing.json")
+    assert len(record.unstored_tracked_paths) == 1
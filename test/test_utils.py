@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from curifactory import utils
 
 
@@ -21,3 +24,19 @@ def test_command_output_does_not_print_to_stderr(capfd):
     out, err = capfd.readouterr()
     assert out == ""
     assert err == ""
+
+
+def test_init_logging_quiets_lazily_imported_library_loggers():
+    """Libraries curifactory imports on first use (e.g. pandas and its numexpr backend)
+    shouldn't log info messages once logging is initialized."""
+    script = (
+        "import logging\n"
+        "from curifactory import utils\n"
+        "utils.init_logging(level=logging.INFO, plain=True)\n"
+        "import pandas\n"
+        "import matplotlib.pyplot\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout == ""